@@ -1,11 +1,234 @@
+import asyncio
+import copy
 import os
-from typing import List, Dict, Any, Optional
-from openai import AzureOpenAI
+import re
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+from openai import AsyncAzureOpenAI
 import json
+import orjson
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Tool result cache lifetimes in seconds (None = never expires).
+# All tools are deterministic in their arguments; metrics are mock data today
+# but are expected to change over time, so they get a short TTL.
+_TOOL_CACHE_TTL: Dict[str, Optional[float]] = {
+    "calculate_risk_score": None,
+    "query_governance_policy": None,
+    "check_compliance_requirements": None,
+    "get_project_metrics": 60.0
+}
+_TOOL_CACHE_MAX_SIZE = 256
+
+# Static data served by the policy and metrics tools (metrics are mock data)
+_POLICIES: Dict[str, Dict[str, Any]] = {
+    "data_privacy": {
+        "summary": "All AI projects must comply with GDPR, CCPA, and data protection regulations",
+        "key_requirements": [
+            "Data minimization",
+            "Encryption at rest and in transit",
+            "Role-based access control",
+            "Privacy impact assessment for PII"
+        ],
+        "approval_required": True
+    },
+    "bias_fairness": {
+        "summary": "AI systems must be tested for bias and ensure fair outcomes",
+        "key_requirements": [
+            "Diverse training data",
+            "Bias testing across demographics",
+            "Fairness metrics monitoring",
+            "Regular bias audits"
+        ],
+        "approval_required": False
+    },
+    "compliance": {
+        "summary": "Ensure compliance with industry regulations and standards",
+        "key_requirements": [
+            "Regulatory mapping",
+            "Compliance documentation",
+            "Audit trail maintenance",
+            "Regular compliance reviews"
+        ],
+        "approval_required": True
+    },
+    "security": {
+        "summary": "Implement robust security measures for AI systems",
+        "key_requirements": [
+            "Secure API endpoints",
+            "Input validation",
+            "Output sanitization",
+            "Security testing"
+        ],
+        "approval_required": False
+    }
+}
+
+_METRICS: Dict[str, Dict[str, Any]] = {
+    "count": {
+        "total_projects": 24,
+        "active_projects": 18,
+        "completed_projects": 6,
+        "by_risk": {"low": 9, "medium": 12, "high": 3}
+    },
+    "risk_distribution": {
+        "low_risk": {"count": 9, "percentage": 37.5},
+        "medium_risk": {"count": 12, "percentage": 50.0},
+        "high_risk": {"count": 3, "percentage": 12.5}
+    },
+    "compliance_status": {
+        "fully_compliant": 18,
+        "partially_compliant": 4,
+        "non_compliant": 2,
+        "compliance_rate": 75.0
+    }
+}
+
+
+def _tool_cache_key(tool_name: str, tool_args: Dict[str, Any]) -> Tuple[str, str]:
+    """Cache key for a tool call: tool name plus canonical JSON of its arguments"""
+    return (tool_name, json.dumps(tool_args, sort_keys=True, separators=(",", ":")))
+
+
+# Observations for the static tool tables, serialized once at import time
+_STATIC_OBSERVATIONS: Dict[Tuple[str, str], str] = {
+    **{
+        _tool_cache_key("query_governance_policy", {"policy_area": area}): orjson.dumps(policy).decode()
+        for area, policy in _POLICIES.items()
+    },
+    **{
+        _tool_cache_key("get_project_metrics", {"metric_type": metric_type}): orjson.dumps(metrics).decode()
+        for metric_type, metrics in _METRICS.items()
+    }
+}
+
+# Tool schemas offered to the LLM. Static, so built once at import time and
+# shared by every AgenticFramework instance.
+_TOOLS: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": "calculate_risk_score",
+            "description": "Calculate AI project risk score based on multiple dimensions",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "data_sensitivity": {
+                        "type": "string",
+                        "enum": ["low", "medium", "high"],
+                        "description": "Level of data sensitivity"
+                    },
+                    "has_pii": {
+                        "type": "boolean",
+                        "description": "Whether project handles PII"
+                    },
+                    "user_impact": {
+                        "type": "string",
+                        "enum": ["low", "medium", "high"],
+                        "description": "Impact on end users"
+                    }
+                },
+                "required": ["data_sensitivity", "has_pii", "user_impact"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "query_governance_policy",
+            "description": "Query enterprise AI governance policies",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "policy_area": {
+                        "type": "string",
+                        "enum": ["data_privacy", "bias_fairness", "compliance", "security"],
+                        "description": "Policy area to query"
+                    }
+                },
+                "required": ["policy_area"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "check_compliance_requirements",
+            "description": "Check compliance requirements for an AI project",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "industry": {
+                        "type": "string",
+                        "description": "Industry sector (e.g., healthcare, finance)"
+                    },
+                    "data_types": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Types of data being processed"
+                    },
+                    "geographic_regions": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Geographic regions where AI will operate"
+                    }
+                },
+                "required": ["industry", "data_types"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_project_metrics",
+            "description": "Get metrics and statistics for AI projects",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "metric_type": {
+                        "type": "string",
+                        "enum": ["count", "risk_distribution", "compliance_status"],
+                        "description": "Type of metrics to retrieve"
+                    },
+                    "filter_by_risk": {
+                        "type": "string",
+                        "enum": ["low", "medium", "high", "all"],
+                        "description": "Filter projects by risk level"
+                    }
+                },
+                "required": ["metric_type"]
+            }
+        }
+    }
+]
+
+_SYSTEM_PROMPT = """You are an AI assistant for enterprise AI governance.
+You have access to tools to help answer questions and complete tasks.
+Use the tools when needed to provide accurate, data-driven responses.
+Think step-by-step and explain your reasoning."""
+
+# Tasks mentioning none of these topics are answered directly, without the tool schema
+_TOOL_TRIGGER_PATTERN = re.compile(
+    r"\b(risk|compli\w*|polic\w*|metric\w*|privacy|bias|fair\w*|secur\w*|pii|gdpr|ccpa|hipaa|"
+    r"regulat\w*|project\w*|industr\w*|health\w*|financ\w*)",
+    re.IGNORECASE
+)
+
+# Tool observations are re-sent to the LLM on every later step, so cap their size
+_MAX_OBSERVATION_CHARS = 2048
+_TRUNCATION_MARKER = "...[truncated]"
+
+
+def _truncate_observation(observation: str) -> str:
+    """Cap a serialized tool result before it is re-injected into the conversation"""
+    if len(observation) <= _MAX_OBSERVATION_CHARS:
+        return observation
+    return observation[:_MAX_OBSERVATION_CHARS - len(_TRUNCATION_MARKER)] + _TRUNCATION_MARKER
+
 
 class AgenticFramework:
     """
@@ -15,7 +238,8 @@ class AgenticFramework:
     
     def __init__(self):
         """Initialize agentic framework with Azure OpenAI"""
-        self.client = AzureOpenAI(
+        # One async client shared by every request so calls reuse its connection pool
+        self.client = AsyncAzureOpenAI(
             api_key=os.getenv("AZURE_OPENAI_API_KEY"),
             api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview"),
             azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT")
@@ -23,104 +247,24 @@ class AgenticFramework:
         
         self.deployment_name = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4")
         
-        # Define available tools
-        self.tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "calculate_risk_score",
-                    "description": "Calculate AI project risk score based on multiple dimensions",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "data_sensitivity": {
-                                "type": "string",
-                                "enum": ["low", "medium", "high"],
-                                "description": "Level of data sensitivity"
-                            },
-                            "has_pii": {
-                                "type": "boolean",
-                                "description": "Whether project handles PII"
-                            },
-                            "user_impact": {
-                                "type": "string",
-                                "enum": ["low", "medium", "high"],
-                                "description": "Impact on end users"
-                            }
-                        },
-                        "required": ["data_sensitivity", "has_pii", "user_impact"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "query_governance_policy",
-                    "description": "Query enterprise AI governance policies",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "policy_area": {
-                                "type": "string",
-                                "enum": ["data_privacy", "bias_fairness", "compliance", "security"],
-                                "description": "Policy area to query"
-                            }
-                        },
-                        "required": ["policy_area"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "check_compliance_requirements",
-                    "description": "Check compliance requirements for an AI project",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "industry": {
-                                "type": "string",
-                                "description": "Industry sector (e.g., healthcare, finance)"
-                            },
-                            "data_types": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Types of data being processed"
-                            },
-                            "geographic_regions": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Geographic regions where AI will operate"
-                            }
-                        },
-                        "required": ["industry", "data_types"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_project_metrics",
-                    "description": "Get metrics and statistics for AI projects",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "metric_type": {
-                                "type": "string",
-                                "enum": ["count", "risk_distribution", "compliance_status"],
-                                "description": "Type of metrics to retrieve"
-                            },
-                            "filter_by_risk": {
-                                "type": "string",
-                                "enum": ["low", "medium", "high", "all"],
-                                "description": "Filter projects by risk level"
-                            }
-                        },
-                        "required": ["metric_type"]
-                    }
-                }
-            }
-        ]
+        self.tools = _TOOLS
+        
+        # Tool name -> bound implementation, built once instead of per call
+        self._tool_map = {
+            "calculate_risk_score": self.calculate_risk_score,
+            "query_governance_policy": self.query_governance_policy,
+            "check_compliance_requirements": self.check_compliance_requirements,
+            "get_project_metrics": self.get_project_metrics
+        }
+        
+        # Memoized tool results: (tool_name, canonical args) -> (result, observation, expiry)
+        self._tool_cache: "OrderedDict[Tuple[str, str], Tuple[Any, str, Optional[float]]]" = OrderedDict()
+        # Tools run in worker threads, so cache reads and writes are serialized
+        self._tool_cache_lock = threading.Lock()
+        
+        # Policies are static, so warm the cache with every policy area up front
+        for policy_area in _POLICIES:
+            self.execute_tool("query_governance_policy", {"policy_area": policy_area})
         
         logger.info("Agentic Framework initialized with tools")
     
@@ -148,50 +292,8 @@ class AgenticFramework:
     
     def query_governance_policy(self, policy_area: str) -> Dict[str, Any]:
         """Tool: Query governance policies"""
-        policies = {
-            "data_privacy": {
-                "summary": "All AI projects must comply with GDPR, CCPA, and data protection regulations",
-                "key_requirements": [
-                    "Data minimization",
-                    "Encryption at rest and in transit",
-                    "Role-based access control",
-                    "Privacy impact assessment for PII"
-                ],
-                "approval_required": True
-            },
-            "bias_fairness": {
-                "summary": "AI systems must be tested for bias and ensure fair outcomes",
-                "key_requirements": [
-                    "Diverse training data",
-                    "Bias testing across demographics",
-                    "Fairness metrics monitoring",
-                    "Regular bias audits"
-                ],
-                "approval_required": False
-            },
-            "compliance": {
-                "summary": "Ensure compliance with industry regulations and standards",
-                "key_requirements": [
-                    "Regulatory mapping",
-                    "Compliance documentation",
-                    "Audit trail maintenance",
-                    "Regular compliance reviews"
-                ],
-                "approval_required": True
-            },
-            "security": {
-                "summary": "Implement robust security measures for AI systems",
-                "key_requirements": [
-                    "Secure API endpoints",
-                    "Input validation",
-                    "Output sanitization",
-                    "Security testing"
-                ],
-                "approval_required": False
-            }
-        }
-        
-        return policies.get(policy_area, {"error": "Policy area not found"})
+        # Copied so callers can't mutate the shared policy table
+        return copy.deepcopy(_POLICIES.get(policy_area, {"error": "Policy area not found"}))
     
     def check_compliance_requirements(
         self,
@@ -225,49 +327,53 @@ class AgenticFramework:
         
         return {
             "industry": industry,
-            "compliance_requirements": list(set(requirements)),
+            "compliance_requirements": list(dict.fromkeys(requirements)),
             "high_risk": len(requirements) > 2,
             "requires_legal_review": len(requirements) > 0
         }
     
     def get_project_metrics(self, metric_type: str, filter_by_risk: str = "all") -> Dict[str, Any]:
         """Tool: Get project metrics (mock data)"""
-        if metric_type == "count":
-            return {
-                "total_projects": 24,
-                "active_projects": 18,
-                "completed_projects": 6,
-                "by_risk": {"low": 9, "medium": 12, "high": 3}
-            }
-        elif metric_type == "risk_distribution":
-            return {
-                "low_risk": {"count": 9, "percentage": 37.5},
-                "medium_risk": {"count": 12, "percentage": 50.0},
-                "high_risk": {"count": 3, "percentage": 12.5}
-            }
-        elif metric_type == "compliance_status":
-            return {
-                "fully_compliant": 18,
-                "partially_compliant": 4,
-                "non_compliant": 2,
-                "compliance_rate": 75.0
-            }
-        
-        return {"error": "Unknown metric type"}
+        # Copied so callers can't mutate the shared metrics table
+        return copy.deepcopy(_METRICS.get(metric_type, {"error": "Unknown metric type"}))
     
     def execute_tool(self, tool_name: str, tool_args: Dict[str, Any]) -> Any:
-        """Execute a tool by name"""
-        tool_map = {
-            "calculate_risk_score": self.calculate_risk_score,
-            "query_governance_policy": self.query_governance_policy,
-            "check_compliance_requirements": self.check_compliance_requirements,
-            "get_project_metrics": self.get_project_metrics
-        }
+        """Execute a tool by name, serving repeated calls from the result cache"""
+        # The cached result is shared, so hand each caller its own copy
+        return copy.deepcopy(self._run_tool(tool_name, tool_args)[0])
+    
+    def _run_tool(self, tool_name: str, tool_args: Dict[str, Any]) -> Tuple[Any, str]:
+        """Execute a tool and return its result along with the JSON observation for the LLM"""
+        key = _tool_cache_key(tool_name, tool_args)
+        
+        with self._tool_cache_lock:
+            cached = self._tool_cache.get(key)
+            if cached is not None:
+                result, observation, expiry = cached
+                if expiry is None or time.monotonic() < expiry:
+                    self._tool_cache.move_to_end(key)
+                    return result, observation
+                del self._tool_cache[key]
+        
+        tool = self._tool_map.get(tool_name)
+        if tool is None:
+            result = {"error": f"Tool {tool_name} not found"}
+            return result, orjson.dumps(result).decode()
+        
+        result = tool(**tool_args)
+        observation = _STATIC_OBSERVATIONS.get(key) or orjson.dumps(result).decode()
         
-        if tool_name in tool_map:
-            return tool_map[tool_name](**tool_args)
-        else:
-            return {"error": f"Tool {tool_name} not found"}
+        ttl = _TOOL_CACHE_TTL.get(tool_name)
+        with self._tool_cache_lock:
+            self._tool_cache[key] = (result, observation, None if ttl is None else time.monotonic() + ttl)
+            if len(self._tool_cache) > _TOOL_CACHE_MAX_SIZE:
+                self._tool_cache.popitem(last=False)
+        
+        return result, observation
+    
+    async def close(self):
+        """Release the client's connections"""
+        await self.client.close()
     
     async def execute_task(
         self,
@@ -287,26 +393,45 @@ class AgenticFramework:
             Task execution result with steps and final answer
         """
         steps = []
+        
+        # The static system prompt stays first and byte-identical across requests so
+        # the provider's prompt-prefix cache can reuse it; per-task context follows it
         messages = [
             {
                 "role": "system",
-                "content": """You are an AI assistant for enterprise AI governance.
-You have access to tools to help answer questions and complete tasks.
-Use the tools when needed to provide accurate, data-driven responses.
-Think step-by-step and explain your reasoning."""
-            },
-            {
-                "role": "user",
-                "content": task_description
+                "content": _SYSTEM_PROMPT
             }
         ]
         
         if context:
-            messages[0]["content"] += f"\n\nContext: {json.dumps(context)}"
+            messages.append({
+                "role": "system",
+                "content": f"Context: {json.dumps(context)}"
+            })
+        
+        messages.append({
+            "role": "user",
+            "content": task_description
+        })
+        
+        # Skip the tool loop (and the tool schema tokens) for tasks no tool can help with
+        if not _TOOL_TRIGGER_PATTERN.search(task_description):
+            response = await self.client.chat.completions.create(
+                model=self.deployment_name,
+                messages=messages,
+                temperature=0.7
+            )
+            
+            return {
+                "final_answer": response.choices[0].message.content,
+                "steps": steps,
+                "total_steps": 0,
+                "success": True
+            }
         
         for step_num in range(max_steps):
             # Call LLM with tools
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.deployment_name,
                 messages=messages,
                 tools=self.tools,
@@ -321,22 +446,28 @@ Think step-by-step and explain your reasoning."""
                 # Add assistant message to history
                 messages.append(assistant_message)
                 
-                # Execute each tool call
-                for tool_call in assistant_message.tool_calls:
+                tool_calls = assistant_message.tool_calls
+                tool_inputs = [json.loads(tool_call.function.arguments) for tool_call in tool_calls]
+                
+                for tool_call in tool_calls:
+                    logger.info(f"Step {step_num + 1}: Calling tool {tool_call.function.name}")
+                
+                # Tool calls within one turn are independent, so run them concurrently
+                tool_results = await asyncio.gather(*(
+                    asyncio.to_thread(self._run_tool, tool_call.function.name, tool_args)
+                    for tool_call, tool_args in zip(tool_calls, tool_inputs)
+                ))
+                
+                # Record results in tool_call order, as the tool message protocol requires
+                for tool_call, tool_args, (_, observation) in zip(tool_calls, tool_inputs, tool_results):
                     tool_name = tool_call.function.name
-                    tool_args = json.loads(tool_call.function.arguments)
-                    
-                    logger.info(f"Step {step_num + 1}: Calling tool {tool_name}")
-                    
-                    # Execute tool
-                    tool_result = self.execute_tool(tool_name, tool_args)
                     
                     # Add tool result to messages
                     messages.append({
                         "role": "tool",
                         "tool_call_id": tool_call.id,
                         "name": tool_name,
-                        "content": json.dumps(tool_result)
+                        "content": _truncate_observation(observation)
                     })
                     
                     # Record step
@@ -345,7 +476,7 @@ Think step-by-step and explain your reasoning."""
                         "action": f"Called tool: {tool_name}",
                         "tool_used": tool_name,
                         "tool_input": tool_args,
-                        "observation": json.dumps(tool_result),
+                        "observation": observation,
                         "reasoning": f"Using {tool_name} to gather information"
                     })
             else:
@@ -1,7 +1,9 @@
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+import re
 import time
 import uuid
 import logging
@@ -22,6 +24,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Risk keyword scanners, compiled once instead of looping over keyword lists per request
+_PII_PATTERN = re.compile("|".join(map(re.escape, [
+    'pii', 'personal', 'customer', 'user data', 'email', 'phone'
+])))
+_SENSITIVE_PATTERN = re.compile("|".join(map(re.escape, [
+    'health', 'medical', 'financial', 'payment', 'ssn', 'credit card'
+])))
+_HIGH_IMPACT_PATTERN = re.compile("|".join(map(re.escape, [
+    'customer-facing', 'production', 'critical', 'automated decision'
+])))
+
+# Root endpoint services never change; only the timestamp is filled in per request
+_ROOT_SERVICES = {
+    "rag": "operational",
+    "agentic": "operational"
+}
+
 # Global instances
 rag_system: Optional[RAGSystem] = None
 agentic_framework: Optional[AgenticFramework] = None
@@ -36,7 +55,7 @@ async def lifespan(app: FastAPI):
     logger.info("Initializing AI Service...")
     try:
         rag_system = RAGSystem()
-        rag_system.seed_sample_data()  # Seed with sample data
+        await rag_system.seed_sample_data()  # Seed with sample data
         agentic_framework = AgenticFramework()
         logger.info("AI Service initialized successfully")
     except Exception as e:
@@ -47,6 +66,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down AI Service...")
+    if rag_system:
+        await rag_system.close()
+    if agentic_framework:
+        await agentic_framework.close()
 
 
 # Create FastAPI app
@@ -54,7 +77,8 @@ app = FastAPI(
     title="AI Enterprise Platform - AI Service",
     description="Python FastAPI service for generative AI, RAG, and agentic AI capabilities",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -67,30 +91,31 @@ app.add_middleware(
 )
 
 
+# Health endpoints are polled constantly by liveness probes, so they return
+# prebuilt bodies through orjson and skip HealthCheck validation
 @app.get("/", response_model=HealthCheck)
 async def root():
     """Root endpoint with service information"""
-    return HealthCheck(
-        status="healthy",
-        version="1.0.0",
-        services={
-            "rag": "operational",
-            "agentic": "operational"
-        }
-    )
+    return ORJSONResponse({
+        "status": "healthy",
+        "version": "1.0.0",
+        "timestamp_unix": time.time(),
+        "services": _ROOT_SERVICES
+    })
 
 
 @app.get("/health", response_model=HealthCheck)
 async def health_check():
     """Health check endpoint"""
-    return HealthCheck(
-        status="healthy",
-        version="1.0.0",
-        services={
+    return ORJSONResponse({
+        "status": "healthy",
+        "version": "1.0.0",
+        "timestamp_unix": time.time(),
+        "services": {
             "rag": "operational" if rag_system else "unavailable",
             "agentic": "operational" if agentic_framework else "unavailable"
         }
-    )
+    })
 
 
 @app.post("/api/rag/query", response_model=RAGResponse)
@@ -118,9 +143,9 @@ async def rag_query(query: RAGQuery):
         
         processing_time = (time.time() - start_time) * 1000
         
-        # Format response
+        # Format response; chunks come from our own vector store, so skip re-validation
         sources = [
-            DocumentChunk(
+            DocumentChunk.model_construct(
                 content=chunk['content'],
                 source=chunk['source'],
                 score=chunk['score'],
@@ -142,6 +167,42 @@ async def rag_query(query: RAGQuery):
         raise HTTPException(status_code=500, detail=f"RAG query failed: {str(e)}")
 
 
+@app.post("/api/rag/query/stream")
+async def rag_query_stream(query: RAGQuery):
+    """
+    Query the RAG system with a streamed answer
+    
+    Retrieves relevant context and streams the AI response as plain text
+    as it is generated
+    """
+    if not rag_system:
+        raise HTTPException(status_code=503, detail="RAG system not initialized")
+    
+    # Retrieve and open the completion before the response starts, so failures
+    # still return a 500 instead of a truncated 200
+    try:
+        deltas = await rag_system.query_stream(
+            query=query.query,
+            top_k=query.top_k,
+            conversation_history=None  # Could be retrieved from database
+        )
+    except Exception as e:
+        logger.error(f"RAG query failed: {e}")
+        raise HTTPException(status_code=500, detail=f"RAG query failed: {str(e)}")
+    
+    async def stream_answer():
+        try:
+            async for delta in deltas:
+                yield delta
+        except Exception as e:
+            # Headers are already sent; re-raising aborts the chunked body, so the
+            # client sees an incomplete transfer rather than a complete-looking answer
+            logger.error(f"RAG stream failed mid-response: {e}")
+            raise
+    
+    return StreamingResponse(stream_answer(), media_type="text/plain")
+
+
 @app.post("/api/agentic/execute", response_model=AgenticResponse)
 async def execute_agentic_task(task: AgenticTask):
     """
@@ -191,19 +252,19 @@ async def assess_risk(request: RiskAssessmentRequest):
         raise HTTPException(status_code=503, detail="Agentic framework not initialized")
     
     try:
+        # Lowercase once; sources are joined on NUL so a keyword phrase such as
+        # "user data" cannot match across the boundary between two sources
+        description = request.description.lower()
+        haystack = description + '\x00' + '\x00'.join(request.data_sources).lower()
+        
         # Determine risk factors
-        has_pii = any(
-            keyword in request.description.lower() or keyword in ' '.join(request.data_sources).lower()
-            for keyword in ['pii', 'personal', 'customer', 'user data', 'email', 'phone']
-        )
+        has_pii = bool(_PII_PATTERN.search(haystack))
         
         # Determine data sensitivity
-        sensitive_keywords = ['health', 'medical', 'financial', 'payment', 'ssn', 'credit card']
-        data_sensitivity = "high" if any(kw in request.description.lower() for kw in sensitive_keywords) else "medium"
+        data_sensitivity = "high" if _SENSITIVE_PATTERN.search(description) else "medium"
         
         # Determine user impact
-        high_impact_keywords = ['customer-facing', 'production', 'critical', 'automated decision']
-        user_impact = "high" if any(kw in request.description.lower() for kw in high_impact_keywords) else "medium"
+        user_impact = "high" if _HIGH_IMPACT_PATTERN.search(description) else "medium"
         
         # Calculate overall risk
         risk_result = agentic_framework.calculate_risk_score(
@@ -261,7 +322,8 @@ async def assess_risk(request: RiskAssessmentRequest):
             risk_level=risk_level,
             risk_scores=risk_scores,
             compliance_requirements=compliance_result['compliance_requirements'],
-            approval_required=risk_level in ["medium", "high"] or compliance_result['requires_legal_review']
+            approval_required=risk_level in ["medium", "high"] or compliance_result['requires_legal_review'],
+            assessment_timestamp=datetime.now(timezone.utc)
         )
     
     except Exception as e:
@@ -273,7 +335,7 @@ async def assess_risk(request: RiskAssessmentRequest):
 async def global_exception_handler(request, exc):
     """Global exception handler"""
     logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content=ErrorResponse(
             error="Internal server error",
@@ -283,5 +345,23 @@ async def global_exception_handler(request, exc):
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Each worker process runs its own lifespan, so it gets its own RAG system
+    # (seed embeddings, in-memory store and caches), agentic framework and client.
+    # "auto" picks uvloop/httptools when installed (not on Windows)
+    workers = int(os.getenv("WORKERS", "1"))
+    if workers > 1 and (os.getenv("VECTOR_STORE_BACKEND") == "chroma" or os.getenv("EMBEDDING_CACHE_PATH")):
+        # Chroma's persistent client and the shelve embedding cache are single-process
+        logger.warning("Chroma backend and EMBEDDING_CACHE_PATH are single-process; running 1 worker")
+        workers = 1
+    # Split the cores between workers so their Numba thread pools don't oversubscribe
+    os.environ.setdefault("NUMBA_NUM_THREADS", str(max(1, (os.cpu_count() or 1) // workers)))
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        loop="auto",
+        http="auto"
+    )
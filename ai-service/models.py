@@ -1,21 +1,18 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal
 from datetime import datetime
-from enum import Enum
+import time
 
 
-class MessageRole(str, Enum):
-    """Message role enumeration"""
-    USER = "user"
-    ASSISTANT = "assistant"
-    SYSTEM = "system"
+# Message roles as plain strings, matching the OpenAI chat message roles
+# (including "tool" for tool results in the agentic loop)
+Role = Literal["user", "assistant", "system", "tool"]
 
 
 class ChatMessage(BaseModel):
     """Chat message model"""
-    role: MessageRole
+    role: Role
     content: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
 class RAGQuery(BaseModel):
@@ -97,14 +94,14 @@ class RiskAssessmentResponse(BaseModel):
     risk_scores: List[RiskScore]
     compliance_requirements: List[str]
     approval_required: bool
-    assessment_timestamp: datetime = Field(default_factory=datetime.utcnow)
+    assessment_timestamp: datetime
 
 
 class HealthCheck(BaseModel):
     """Health check response"""
     status: str
     version: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp_unix: float = Field(default_factory=time.time)
     services: Dict[str, str] = Field(default_factory=dict)
 
 
@@ -112,4 +109,4 @@ class ErrorResponse(BaseModel):
     """Error response model"""
     error: str
     detail: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp_unix: float = Field(default_factory=time.time)
@@ -1,14 +1,90 @@
+import asyncio
+import hashlib
+import json
 import os
-from typing import List, Dict, Any, Optional
-from openai import AzureOpenAI
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+import shelve
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+from openai import AsyncAzureOpenAI, APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
 from langchain_openai import AzureOpenAIEmbeddings
 import chromadb
+import httpx
+import numpy as np
+import tiktoken
 from chromadb.config import Settings
 import logging
 
+from vector_store import InMemoryVectorStore
+
 logger = logging.getLogger(__name__)
 
+# Large ingests are embedded in sub-batches, several in flight at once
+_EMBEDDING_BATCH_SIZE = 256
+_EMBEDDING_CONCURRENCY = 8
+_EMBEDDING_MAX_RETRIES = 5
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+
+# Repeated questions are common, so query embeddings (LRU) and full answers
+# (LRU with a TTL) are cached in memory
+_QUERY_EMBEDDING_CACHE_SIZE = 1024
+_ANSWER_CACHE_SIZE = 1024
+_ANSWER_CACHE_TTL = 300.0
+
+# Documents are chunked on tokens of the embedding model's tokenizer (ada-002
+# uses cl100k_base); 250 tokens is roughly the previous 1000-character chunk
+_CHUNK_ENCODING = "cl100k_base"
+_CHUNK_SIZE_TOKENS = 250
+_CHUNK_OVERLAP_TOKENS = 50
+
+# Conversation history is trimmed to whatever fits the chat model's context
+# window after the prompt, retrieved context, query and completion budget
+_CONTEXT_WINDOW_TOKENS = 8192
+_MAX_COMPLETION_TOKENS = 800
+# Chat formatting adds about 4 tokens per message (role and separators) and
+# 3 tokens priming the reply, on top of the content tokens
+_TOKENS_PER_MESSAGE = 4
+_REPLY_PRIMING_TOKENS = 3
+
+_SYSTEM_PROMPT = """You are an AI assistant for an enterprise AI governance platform.
+Your role is to provide accurate, helpful information based on the provided context.
+
+Guidelines:
+1. Answer based primarily on the provided context
+2. If the context doesn't contain enough information, acknowledge this
+3. Cite sources when providing information
+4. Be clear, concise, and professional
+5. If asked about AI governance, emphasize compliance and risk management
+
+The context retrieved for each question is provided in a system message
+immediately before the question."""
+
+
+def _split_tokens(encoding: tiktoken.Encoding, tokens: List[int]) -> List[str]:
+    """Decode overlapping fixed-size token windows into chunk texts"""
+    step = _CHUNK_SIZE_TOKENS - _CHUNK_OVERLAP_TOKENS
+    windows = [
+        tokens[i:i + _CHUNK_SIZE_TOKENS]
+        for i in range(0, max(len(tokens) - _CHUNK_OVERLAP_TOKENS, 1), step)
+    ]
+    # A window edge can split a multi-byte character across tokens; the source
+    # text is valid UTF-8, so dropping undecodable bytes only trims those edges
+    chunks = (data.decode("utf-8", "ignore") for data in encoding.decode_bytes_batch(windows))
+    return [chunk for chunk in chunks if chunk.strip()]
+
+
+def _answer_cache_key(query: str, top_k: int, conversation_history: Optional[List[Dict[str, str]]]) -> str:
+    """Hash of the fields that determine an answer, serialized as one structured value"""
+    return hashlib.sha256(json.dumps([query, top_k, conversation_history or []]).encode()).hexdigest()
+
+
+def _normalize(vectors: List[List[float]]) -> np.ndarray:
+    """L2-normalize embeddings so cosine similarity reduces to a dot product"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=-1, keepdims=True), 1e-12)
+
 
 class RAGSystem:
     """
@@ -16,13 +92,34 @@ class RAGSystem:
     Implements semantic search and context-aware generation
     """
     
-    def __init__(self):
-        """Initialize RAG system with Azure OpenAI and vector store"""
-        # Azure OpenAI Configuration
-        self.client = AzureOpenAI(
+    def __init__(self, backend: Optional[str] = None, embedding_dtype: Optional[str] = None):
+        """
+        Initialize RAG system with Azure OpenAI and vector store
+        
+        Args:
+            backend: "numpy" for the in-process vector store or "chroma" for ChromaDB
+                (default: VECTOR_STORE_BACKEND, else "numpy")
+            embedding_dtype: Storage type for the numpy backend: "int8" (about 4x less
+                memory), "bfloat16" (2x) or "float32" (default: EMBEDDING_DTYPE, else "int8")
+                Quantized stores with at least BINARY_PREFILTER_MIN_ROWS rows (default
+                20000, 0 disables) narrow each query with a binary prefilter
+        """
+        self.backend = backend = backend or os.getenv("VECTOR_STORE_BACKEND", "numpy")
+        embedding_dtype = embedding_dtype or os.getenv("EMBEDDING_DTYPE", "int8")
+        
+        # One HTTP/2 connection pool shared by chat and embedding calls, so
+        # concurrent requests multiplex over a few kept-alive connections
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        )
+        
+        # Azure OpenAI Configuration (async, shared across requests)
+        self.client = AsyncAzureOpenAI(
             api_key=os.getenv("AZURE_OPENAI_API_KEY"),
             api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview"),
-            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT")
+            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+            http_client=self._http_client
         )
         
         self.deployment_name = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4")
@@ -35,28 +132,176 @@ class RAGSystem:
             azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
             api_key=os.getenv("AZURE_OPENAI_API_KEY")
         )
+        # AzureOpenAIEmbeddings hands http_client to its sync client as well, which
+        # rejects an async one, so swap in an async client on the shared pool instead
+        self.embeddings.async_client = AsyncAzureOpenAI(
+            api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+            api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview"),
+            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+            azure_deployment=self.embedding_deployment,
+            http_client=self._http_client
+        ).embeddings
+        
+        # Vector Store: in-process NumPy store, or ChromaDB
+        if backend == "numpy":
+            prefilter_min_rows = int(os.getenv("BINARY_PREFILTER_MIN_ROWS", "20000"))
+            self.collection = InMemoryVectorStore(
+                dtype=embedding_dtype,
+                prefilter_min_rows=prefilter_min_rows or None
+            )
+        elif backend == "chroma":
+            # Persisted on disk, so the index is reloaded rather than rebuilt on start
+            self.chroma_client = chromadb.PersistentClient(
+                path=os.getenv("CHROMA_PATH", "./chroma"),
+                settings=Settings(
+                    anonymized_telemetry=False,
+                    allow_reset=True
+                )
+            )
+            
+            # Create or get collection
+            self.collection = self.chroma_client.get_or_create_collection(
+                name="enterprise_docs",
+                metadata={
+                    "description": "Enterprise documentation and policies",
+                    # Embeddings are unit-normalized, so inner product ranks like cosine
+                    "hnsw:space": "ip",
+                    "hnsw:M": 32,
+                    "hnsw:construction_ef": 200,
+                    "hnsw:search_ef": 64
+                }
+            )
+        else:
+            raise ValueError(f"Unsupported vector store backend: {backend}")
         
-        # Vector Store (ChromaDB for local development)
-        self.chroma_client = chromadb.Client(Settings(
-            anonymized_telemetry=False,
-            allow_reset=True
-        ))
+        # Tokenizer for the chat model, used to count tokens of streamed responses
+        self.encoding = tiktoken.get_encoding("cl100k_base")
+        self._system_prompt_tokens = len(self.encoding.encode(_SYSTEM_PROMPT))
         
-        # Create or get collection
-        self.collection = self.chroma_client.get_or_create_collection(
-            name="enterprise_docs",
-            metadata={"description": "Enterprise documentation and policies"}
-        )
+        # Tokenizer for chunking documents
+        self.chunk_encoding = tiktoken.get_encoding(_CHUNK_ENCODING)
         
-        # Text splitter for chunking
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=200,
-            length_function=len,
-        )
+        # Optional on-disk chunk embedding cache (chunk hash -> vector) that survives
+        # restarts; single-process only, so leave unset when running several workers
+        embedding_cache_path = os.getenv("EMBEDDING_CACHE_PATH")
+        self._embedding_store = shelve.open(embedding_cache_path) if embedding_cache_path else None
+        # Cache I/O runs in worker threads, and shelve is not thread-safe
+        self._embedding_store_lock = threading.Lock()
+        
+        # sha256(query) -> query embedding
+        self._query_embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        # sha256([query, top_k, history]) -> (RAG result, expiry)
+        self._answer_cache: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
         
         logger.info("RAG System initialized successfully")
     
+    async def close(self):
+        """Release the shared HTTP connection pool and the embedding cache"""
+        await self._http_client.aclose()
+        if self._embedding_store is not None:
+            with self._embedding_store_lock:
+                self._embedding_store.close()
+    
+    async def _embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts in fixed-size sub-batches, fired concurrently
+        
+        Args:
+            texts: Texts to embed
+        
+        Returns:
+            Embeddings in the same order as texts
+        """
+        semaphore = asyncio.Semaphore(_EMBEDDING_CONCURRENCY)
+        
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                # Retry each sub-batch on its own so one throttled request
+                # does not fail the whole ingest
+                for attempt in range(_EMBEDDING_MAX_RETRIES):
+                    try:
+                        return await self.embeddings.aembed_documents(batch)
+                    except _RETRYABLE_ERRORS as e:
+                        if attempt == _EMBEDDING_MAX_RETRIES - 1:
+                            raise
+                        delay = 2 ** attempt
+                        logger.warning(f"Embedding batch failed ({e}), retrying in {delay}s")
+                        await asyncio.sleep(delay)
+        
+        batches = [
+            texts[i:i + _EMBEDDING_BATCH_SIZE]
+            for i in range(0, len(texts), _EMBEDDING_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+        
+        return [embedding for batch_embeddings in results for embedding in batch_embeddings]
+    
+    def _chunk_hash(self, chunk: str) -> str:
+        """Content hash of a chunk, scoped to the embedding deployment"""
+        return hashlib.blake2b(f"{self.embedding_deployment}\x00{chunk}".encode()).hexdigest()
+    
+    def _load_cached_embeddings(self, hashes: List[str]) -> Dict[str, List[float]]:
+        """Read the chunk hashes present in the on-disk embedding cache"""
+        vectors = {}
+        with self._embedding_store_lock:
+            for chunk_hash in hashes:
+                vector = self._embedding_store.get(chunk_hash)
+                if vector is not None:
+                    vectors[chunk_hash] = vector
+        return vectors
+    
+    def _store_cached_embeddings(self, vectors: Dict[str, List[float]]):
+        """Write new chunk embeddings to the on-disk cache"""
+        with self._embedding_store_lock:
+            for chunk_hash, embedding in vectors.items():
+                self._embedding_store[chunk_hash] = embedding
+            self._embedding_store.sync()
+    
+    async def _embed_unique(self, chunks_by_hash: Dict[str, str]) -> Dict[str, List[float]]:
+        """
+        Embed distinct chunks, reusing vectors from the on-disk cache when enabled
+        
+        Args:
+            chunks_by_hash: Chunk hash -> chunk text
+        
+        Returns:
+            Chunk hash -> embedding
+        """
+        vectors = {}
+        if self._embedding_store is not None:
+            # Disk reads and writes go through worker threads to keep the event loop free
+            vectors = await asyncio.to_thread(self._load_cached_embeddings, list(chunks_by_hash))
+        
+        missing = [chunk_hash for chunk_hash in chunks_by_hash if chunk_hash not in vectors]
+        if missing:
+            embeddings = await self._embed_documents([chunks_by_hash[chunk_hash] for chunk_hash in missing])
+            vectors.update(zip(missing, embeddings))
+            
+            if self._embedding_store is not None:
+                await asyncio.to_thread(self._store_cached_embeddings, dict(zip(missing, embeddings)))
+        
+        logger.info(f"Embedded {len(missing)} of {len(chunks_by_hash)} distinct chunks")
+        return vectors
+    
+    async def _chunk_documents(self, contents: List[str]) -> List[List[str]]:
+        """
+        Split document contents into chunks
+        
+        All documents are tokenized in one batched call, which tiktoken already
+        spreads over native threads; it runs in a worker thread to stay off the event loop.
+        
+        Args:
+            contents: Document texts
+        
+        Returns:
+            Chunk texts for each document, in order
+        """
+        def chunk_all() -> List[List[str]]:
+            token_lists = self.chunk_encoding.encode_ordinary_batch(contents)
+            return [_split_tokens(self.chunk_encoding, tokens) for tokens in token_lists]
+        
+        return await asyncio.to_thread(chunk_all)
+    
     async def add_documents(self, documents: List[Dict[str, Any]]) -> int:
         """
         Add documents to the vector store
@@ -67,36 +312,70 @@ class RAGSystem:
         Returns:
             Number of chunks added
         """
-        total_chunks = 0
+        ids = []
+        chunk_texts = []
+        metadatas = []
         
-        for doc in documents:
-            # Split document into chunks
-            chunks = self.text_splitter.split_text(doc['content'])
-            
-            # Generate embeddings and add to vector store
+        chunks_per_doc = await self._chunk_documents([doc['content'] for doc in documents])
+        
+        for doc, chunks in zip(documents, chunks_per_doc):
             for i, chunk in enumerate(chunks):
-                chunk_id = f"{doc['source']}_{i}"
-                
-                # Get embedding
-                embedding = await self.embeddings.aembed_query(chunk)
-                
-                # Add to ChromaDB
-                self.collection.add(
-                    ids=[chunk_id],
-                    embeddings=[embedding],
-                    documents=[chunk],
-                    metadatas=[{
-                        "source": doc['source'],
-                        "chunk_index": i,
-                        **doc.get('metadata', {})
-                    }]
-                )
-                
-                total_chunks += 1
+                ids.append(f"{doc['source']}_{i}")
+                chunk_texts.append(chunk)
+                metadatas.append({
+                    "source": doc['source'],
+                    "chunk_index": i,
+                    **doc.get('metadata', {})
+                })
+        
+        if not chunk_texts:
+            return 0
+        
+        # Embed each distinct chunk once; repeated boilerplate reuses its vector
+        hashes = [self._chunk_hash(chunk) for chunk in chunk_texts]
+        vectors = await self._embed_unique(dict(zip(hashes, chunk_texts)))
+        embeddings = _normalize([vectors[chunk_hash] for chunk_hash in hashes]).tolist()
+        
+        # Add to the vector store in a single write
+        write = partial(
+            self.collection.add,
+            ids=ids,
+            embeddings=embeddings,
+            documents=chunk_texts,
+            metadatas=metadatas
+        )
+        if self.backend == "chroma":
+            # Chroma writes block on SQLite and index updates, so keep them off the event loop
+            await asyncio.to_thread(write)
+        else:
+            # The NumPy store is not thread-safe and an append is only an array copy
+            write()
+        
+        total_chunks = len(chunk_texts)
+        
+        # New content can change answers, so cached ones are no longer valid
+        self._answer_cache.clear()
         
         logger.info(f"Added {total_chunks} chunks from {len(documents)} documents")
         return total_chunks
     
+    async def _embed_query(self, query: str) -> List[float]:
+        """Embed a query, serving repeated queries from the LRU cache"""
+        key = hashlib.sha256(query.encode()).hexdigest()
+        
+        embedding = self._query_embedding_cache.get(key)
+        if embedding is not None:
+            self._query_embedding_cache.move_to_end(key)
+            return embedding
+        
+        embedding = _normalize(await self.embeddings.aembed_query(query)).tolist()
+        
+        self._query_embedding_cache[key] = embedding
+        if len(self._query_embedding_cache) > _QUERY_EMBEDDING_CACHE_SIZE:
+            self._query_embedding_cache.popitem(last=False)
+        
+        return embedding
+    
     async def retrieve_context(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """
         Retrieve relevant context for a query
@@ -109,7 +388,7 @@ class RAGSystem:
             List of relevant document chunks with metadata
         """
         # Generate query embedding
-        query_embedding = await self.embeddings.aembed_query(query)
+        query_embedding = await self._embed_query(query)
         
         # Search vector store
         results = self.collection.query(
@@ -131,74 +410,141 @@ class RAGSystem:
         logger.info(f"Retrieved {len(context_chunks)} context chunks for query")
         return context_chunks
     
-    async def generate_response(
+    def _build_messages(
         self,
         query: str,
         context_chunks: List[Dict[str, Any]],
         conversation_history: Optional[List[Dict[str, str]]] = None
-    ) -> Dict[str, Any]:
-        """
-        Generate response using retrieved context
-        
-        Args:
-            query: User query
-            context_chunks: Retrieved context chunks
-            conversation_history: Previous conversation messages
-        
-        Returns:
-            Generated response with metadata
-        """
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for a query and its retrieved context"""
         # Build context string
-        context_str = "\n\n".join([
+        context_str = "\n\n".join(
             f"[Source: {chunk['source']}]\n{chunk['content']}"
             for chunk in context_chunks
-        ])
+        )
         
-        # Build system prompt
-        system_prompt = """You are an AI assistant for an enterprise AI governance platform.
-Your role is to provide accurate, helpful information based on the provided context.
-
-Guidelines:
-1. Answer based primarily on the provided context
-2. If the context doesn't contain enough information, acknowledge this
-3. Cite sources when providing information
-4. Be clear, concise, and professional
-5. If asked about AI governance, emphasize compliance and risk management
-
-Context:
-{context}
-"""
+        context_message = {"role": "system", "content": f"Context:\n{context_str}"}
+        query_message = {"role": "user", "content": query}
         
-        # Build messages
+        # Static prompt first so the prefix is identical across requests (and
+        # cacheable); the variable context comes after the conversation history
         messages = [
-            {"role": "system", "content": system_prompt.format(context=context_str)}
+            {"role": "system", "content": _SYSTEM_PROMPT}
         ]
         
-        # Add conversation history if provided
+        # Add the most recent conversation history that fits the token budget
         if conversation_history:
-            messages.extend(conversation_history[-5:])  # Last 5 messages for context
+            budget = (
+                _CONTEXT_WINDOW_TOKENS - _MAX_COMPLETION_TOKENS - _REPLY_PRIMING_TOKENS
+                - self._system_prompt_tokens
+                - len(self.encoding.encode(context_message['content']))
+                - len(self.encoding.encode(query))
+                - 3 * _TOKENS_PER_MESSAGE  # system prompt, context and query messages
+            )
+            picked = []
+            for message in reversed(conversation_history):
+                budget -= len(self.encoding.encode(message['content'])) + _TOKENS_PER_MESSAGE
+                if budget < 0:
+                    break
+                picked.append(message)
+            messages.extend(reversed(picked))
+        
+        messages.append(context_message)
         
         # Add current query
-        messages.append({"role": "user", "content": query})
+        messages.append(query_message)
         
-        # Generate response
-        response = self.client.chat.completions.create(
+        return messages
+    
+    async def _open_completion_stream(self, messages: List[Dict[str, str]]) -> Any:
+        """Start a streamed chat completion; request errors surface here"""
+        return await self.client.chat.completions.create(
             model=self.deployment_name,
             messages=messages,
             temperature=0.7,
-            max_tokens=800,
-            top_p=0.95
+            max_tokens=_MAX_COMPLETION_TOKENS,
+            top_p=0.95,
+            stream=True
         )
+    
+    async def _iter_deltas(self, stream: Any) -> AsyncIterator[str]:
+        """Yield the text deltas of an open completion stream, then release it"""
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            await stream.response.aclose()
+    
+    async def _stream_completion(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Stream completion text deltas as they are generated"""
+        stream = await self._open_completion_stream(messages)
+        
+        async for delta in self._iter_deltas(stream):
+            yield delta
+    
+    async def generate_response_stream(
+        self,
+        query: str,
+        context_chunks: List[Dict[str, Any]],
+        conversation_history: Optional[List[Dict[str, str]]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Generate a response using retrieved context, yielding text as it is generated
         
-        answer = response.choices[0].message.content
+        Args:
+            query: User query
+            context_chunks: Retrieved context chunks
+            conversation_history: Previous conversation messages
         
-        # Calculate confidence score (simplified)
-        confidence = min(0.95, sum(chunk['score'] for chunk in context_chunks) / len(context_chunks))
+        Yields:
+            Response text deltas
+        """
+        messages = self._build_messages(query, context_chunks, conversation_history)
+        
+        async for delta in self._stream_completion(messages):
+            yield delta
+    
+    async def generate_response(
+        self,
+        query: str,
+        context_chunks: List[Dict[str, Any]],
+        conversation_history: Optional[List[Dict[str, str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate response using retrieved context
+        
+        Args:
+            query: User query
+            context_chunks: Retrieved context chunks
+            conversation_history: Previous conversation messages
+        
+        Returns:
+            Generated response with metadata
+        """
+        messages = self._build_messages(query, context_chunks, conversation_history)
+        
+        # Generate response
+        answer = "".join([delta async for delta in self._stream_completion(messages)])
+        
+        # Streaming responses carry no usage block, so count tokens locally
+        tokens_used = sum(len(self.encoding.encode(message['content'])) for message in messages)
+        tokens_used += len(self.encoding.encode(answer))
+        
+        # Calculate confidence score (simplified): mean retrieval score, clipped to [0, 0.95]
+        confidence = 0.0
+        if context_chunks:
+            scores = np.fromiter(
+                (chunk['score'] for chunk in context_chunks),
+                dtype=np.float32,
+                count=len(context_chunks)
+            )
+            confidence = float(np.clip(np.mean(scores), 0.0, 0.95))
         
         return {
             'answer': answer,
             'confidence_score': confidence,
-            'tokens_used': response.usage.total_tokens
+            'tokens_used': tokens_used
         }
     
     async def query(
@@ -218,21 +564,71 @@ Context:
         Returns:
             Complete RAG response
         """
+        # Serve identical questions (same top_k and history) from the answer cache
+        cache_key = _answer_cache_key(query, top_k, conversation_history)
+        
+        cached = self._answer_cache.get(cache_key)
+        if cached is not None:
+            result, expiry = cached
+            if time.monotonic() < expiry:
+                self._answer_cache.move_to_end(cache_key)
+                return result
+            del self._answer_cache[cache_key]
+        
         # Retrieve context
         context_chunks = await self.retrieve_context(query, top_k)
         
         # Generate response
         response_data = await self.generate_response(query, context_chunks, conversation_history)
         
-        return {
+        result = {
             'answer': response_data['answer'],
             'sources': context_chunks,
             'confidence_score': response_data['confidence_score'],
             'tokens_used': response_data['tokens_used']
         }
+        
+        self._answer_cache[cache_key] = (result, time.monotonic() + _ANSWER_CACHE_TTL)
+        if len(self._answer_cache) > _ANSWER_CACHE_SIZE:
+            self._answer_cache.popitem(last=False)
+        
+        return result
+    
+    async def query_stream(
+        self,
+        query: str,
+        top_k: int = 5,
+        conversation_history: Optional[List[Dict[str, str]]] = None
+    ) -> AsyncIterator[str]:
+        """
+        RAG pipeline with a streamed answer: retrieve, then stream generated text
+        
+        Retrieval and the completion request finish before this returns, so their
+        failures raise here rather than partway through the stream.
+        
+        Args:
+            query: User query
+            top_k: Number of context chunks to retrieve
+            conversation_history: Previous conversation
+        
+        Returns:
+            Async iterator of response text deltas
+        """
+        context_chunks = await self.retrieve_context(query, top_k)
+        
+        messages = self._build_messages(query, context_chunks, conversation_history)
+        stream = await self._open_completion_stream(messages)
+        
+        return self._iter_deltas(stream)
     
-    def seed_sample_data(self):
+    async def seed_sample_data(self):
         """Seed vector store with sample enterprise documentation"""
+        # A persistent Chroma store keeps its documents across restarts, so only
+        # seed an empty store instead of re-embedding the samples on every start
+        if await asyncio.to_thread(self.collection.count):
+            logger.info("Vector store already populated, skipping sample data")
+            return
+        
         sample_docs = [
             {
                 'content': """AI Governance Policy - Data Privacy and Security
@@ -325,7 +721,6 @@ Implementation Guidelines:
             }
         ]
         
-        # Add synchronously for seeding
-        import asyncio
-        asyncio.run(self.add_documents(sample_docs))
+        # All sample documents go through one batched ingest
+        await self.add_documents(sample_docs)
         logger.info("Sample data seeded successfully")
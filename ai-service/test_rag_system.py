@@ -0,0 +1,94 @@
+import asyncio
+from collections import OrderedDict
+
+from rag_system import (
+    RAGSystem,
+    _CONTEXT_WINDOW_TOKENS,
+    _MAX_COMPLETION_TOKENS,
+    _REPLY_PRIMING_TOKENS,
+    _SYSTEM_PROMPT,
+    _TOKENS_PER_MESSAGE,
+    _answer_cache_key
+)
+
+
+def _rag_without_clients(calls):
+    """RAGSystem with retrieval and generation stubbed out, so no API clients are built"""
+    rag = RAGSystem.__new__(RAGSystem)
+    rag._answer_cache = OrderedDict()
+    
+    async def retrieve_context(query, top_k):
+        calls.append((query, top_k))
+        return []
+    
+    async def generate_response(query, context_chunks, conversation_history):
+        return {'answer': query, 'confidence_score': 0.0, 'tokens_used': 0}
+    
+    rag.retrieve_context = retrieve_context
+    rag.generate_response = generate_response
+    return rag
+
+
+def test_query_and_top_k_do_not_share_cache_entries():
+    calls = []
+    rag = _rag_without_clients(calls)
+    
+    # Concatenated without separators, both keys would read "policy15[]"
+    first = asyncio.run(rag.query("policy1", top_k=5))
+    second = asyncio.run(rag.query("policy", top_k=15))
+    
+    assert calls == [("policy1", 5), ("policy", 15)]
+    assert (first['answer'], second['answer']) == ("policy1", "policy")
+
+
+def test_repeated_query_is_served_from_cache():
+    calls = []
+    rag = _rag_without_clients(calls)
+    
+    asyncio.run(rag.query("policy", top_k=5))
+    asyncio.run(rag.query("policy", top_k=5))
+    
+    assert calls == [("policy", 5)]
+
+
+def test_answer_cache_key_separates_history():
+    history = [{"role": "user", "content": "earlier question"}]
+    
+    assert _answer_cache_key("question", 5, history) != _answer_cache_key("question", 5, None)
+    assert _answer_cache_key("question", 5, []) == _answer_cache_key("question", 5, None)
+
+
+class _CharEncoding:
+    """One token per character, standing in for tiktoken"""
+    
+    def encode(self, text):
+        return list(text)
+
+
+def test_history_budget_counts_per_message_overhead():
+    rag = RAGSystem.__new__(RAGSystem)
+    rag.encoding = _CharEncoding()
+    rag._system_prompt_tokens = len(rag.encoding.encode(_SYSTEM_PROMPT))
+    # Many short turns: content alone fits, but per-message overhead would not
+    history = [{"role": "user", "content": "ok"} for _ in range(5000)]
+    
+    messages = rag._build_messages("question", [{'source': 'doc', 'content': 'context'}], history)
+    
+    prompt_tokens = sum(len(m['content']) + _TOKENS_PER_MESSAGE for m in messages) + _REPLY_PRIMING_TOKENS
+    assert prompt_tokens + _MAX_COMPLETION_TOKENS <= _CONTEXT_WINDOW_TOKENS
+    assert len(messages) > 3
+
+
+def test_seed_sample_data_skips_populated_store():
+    rag = RAGSystem.__new__(RAGSystem)
+    rag.collection = type("Collection", (), {"count": lambda self: 13})()
+    added = []
+    
+    async def add_documents(documents):
+        added.append(documents)
+        return 0
+    
+    rag.add_documents = add_documents
+    asyncio.run(rag.seed_sample_data())
+    
+    assert added == []
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from vector_store import InMemoryVectorStore, _INITIAL_CAPACITY
+
+
+def _unit_vectors(n, dim=64, seed=0):
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((n, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _fill(store, vectors, prefix="doc"):
+    ids = [f"{prefix}_{i}" for i in range(len(vectors))]
+    store.add(
+        ids=ids,
+        embeddings=vectors.tolist(),
+        documents=[f"text {i}" for i in ids],
+        metadatas=[{"source": i} for i in ids]
+    )
+    return ids
+
+
+@pytest.mark.parametrize("dtype,min_recall", [("float32", 1.0), ("bfloat16", 0.95), ("int8", 0.9)])
+def test_recall_matches_exact_fp32_scan(dtype, min_recall):
+    vectors = _unit_vectors(500)
+    queries = _unit_vectors(20, seed=1)
+    store = InMemoryVectorStore(dtype=dtype)
+    ids = _fill(store, vectors)
+    
+    exact = np.argsort(-(queries @ vectors.T), axis=1)[:, :5]
+    results = store.query(query_embeddings=queries.tolist(), n_results=5)
+    
+    hits = sum(
+        len(set(found) & {ids[i] for i in expected})
+        for found, expected in zip(results["ids"], exact)
+    )
+    assert hits / exact.size >= min_recall
+
+
+def test_binary_prefilter_finds_nearest():
+    vectors = _unit_vectors(1000)
+    store = InMemoryVectorStore(dtype="int8", prefilter_min_rows=200)
+    ids = _fill(store, vectors)
+    
+    results = store.query(query_embeddings=vectors[:10].tolist(), n_results=3)
+    
+    assert [found[0] for found in results["ids"]] == ids[:10]
+
+
+def test_bfloat16_rounds_to_nearest_even():
+    store = InMemoryVectorStore(dtype="bfloat16")
+    # Halfway between 1.0 (0x3F80) and 1 + 2^-7 (0x3F81) rounds down to even;
+    # halfway between 0x3F81 and 0x3F82 rounds up to even; others round to nearest
+    values = np.array([[1 + 2 ** -8, 1 + 3 * 2 ** -8, 1 + 2 ** -9, 1 + 3 * 2 ** -9]], dtype=np.float32)
+    
+    codes, scales = store._encode(values)
+    
+    assert codes.tolist() == [[0x3F80, 0x3F82, 0x3F80, 0x3F81]]
+    assert scales.tolist() == [1.0]
+
+
+def test_duplicate_ids_are_skipped():
+    vectors = _unit_vectors(3)
+    store = InMemoryVectorStore()
+    _fill(store, vectors)
+    
+    store.add(
+        ids=["doc_0", "new"],
+        embeddings=vectors[:2].tolist(),
+        documents=["replacement", "new text"],
+        metadatas=[{}, {}]
+    )
+    
+    assert store.count() == 4
+    results = store.query(query_embeddings=[vectors[0].tolist()], n_results=4)
+    assert "replacement" not in results["documents"][0]
+
+
+def test_capacity_grows_across_adds():
+    batches = [_unit_vectors(_INITIAL_CAPACITY - 1, seed=seed) for seed in range(3)]
+    store = InMemoryVectorStore()
+    for n, batch in enumerate(batches):
+        _fill(store, batch, prefix=f"batch{n}")
+    
+    assert store.count() == 3 * (_INITIAL_CAPACITY - 1)
+    for n, batch in enumerate(batches):
+        results = store.query(query_embeddings=[batch[7].tolist()], n_results=1)
+        assert results["ids"][0] == [f"batch{n}_7"]
+        assert results["metadatas"][0] == [{"source": f"batch{n}_7"}]
+
+
+def test_empty_store_returns_empty_results():
+    store = InMemoryVectorStore()
+    
+    results = store.query(query_embeddings=[[0.1, 0.2], [0.3, 0.4]], n_results=5)
+    
+    assert store.count() == 0
+    assert results == {
+        "ids": [[], []],
+        "documents": [[], []],
+        "metadatas": [[], []],
+        "distances": [[], []]
+    }
+
+
+@pytest.mark.parametrize("dtype", ["int8", "bfloat16", "float32"])
+def test_query_dimension_mismatch_raises(dtype):
+    store = InMemoryVectorStore(dtype=dtype)
+    _fill(store, _unit_vectors(3))
+    
+    with pytest.raises(ValueError):
+        store.query(query_embeddings=[[0.1] * 8], n_results=3)
@@ -0,0 +1,244 @@
+from typing import List, Dict, Any, Optional
+import numpy as np
+import logging
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+# Storage types and their NumPy code dtypes: int8 (~4x smaller than fp32),
+# bfloat16 (2x smaller, held as uint16) and uncompressed float32
+EMBEDDING_DTYPES = {
+    "int8": np.int8,
+    "bfloat16": np.uint16,
+    "float32": np.float32
+}
+
+_INITIAL_CAPACITY = 64
+
+# Quantized stores with at least this many rows are prefiltered by Hamming
+# distance between sign-bit codes, and only the closest candidates (at least
+# _RERANK_CANDIDATES, or _RERANK_OVERSAMPLE x n_results) are reranked with the
+# stored vectors. Below this the exact scan is as fast or faster
+_PREFILTER_MIN_ROWS = 20000
+_RERANK_CANDIDATES = 100
+_RERANK_OVERSAMPLE = 10
+
+# Set-bit count per byte value, for NumPy builds without bitwise_count (< 2.0)
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(bits: np.ndarray) -> np.ndarray:
+    """Number of set bits in each uint8 element"""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(bits)
+    return _POPCOUNT_TABLE[bits]
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _int8_dot(codes, q, out):
+        """Dot product of int8 rows with an fp32 query, rows spread across cores"""
+        for i in prange(codes.shape[0]):
+            total = np.float32(0)
+            for j in range(codes.shape[1]):
+                total += np.float32(codes[i, j]) * q[j]
+            out[i] = total
+else:
+    # Numba is optional; without it the int8 scan falls back to NumPy
+    _int8_dot = None
+
+
+class InMemoryVectorStore:
+    """
+    In-process NumPy vector store: one contiguous (N, D) embedding matrix scanned
+    with a single matmul per query, optionally compressed to int8 or bfloat16
+    Mirrors the ChromaDB collection add/query interface so RAGSystem can use either
+    
+    Embeddings are expected to be L2-normalized, so similarity is a bare dot product
+    (the equivalent of ChromaDB's "ip" space)
+    """
+    
+    def __init__(self, dtype: str = "int8", prefilter_min_rows: Optional[int] = _PREFILTER_MIN_ROWS):
+        """
+        Initialize an empty store
+        
+        Args:
+            dtype: Storage type for embeddings, one of EMBEDDING_DTYPES
+            prefilter_min_rows: Row count from which int8/bfloat16 queries use the
+                binary prefilter; None disables it. float32 stores always scan exactly
+        """
+        if dtype not in EMBEDDING_DTYPES:
+            raise ValueError(f"Unsupported embedding dtype: {dtype}")
+        self.dtype = dtype
+        self.prefilter_min_rows = None if dtype == "float32" else prefilter_min_rows
+        
+        if dtype == "int8" and _int8_dot is not None:
+            # Compile (or load from cache) now, on the creating thread, rather than
+            # on the first query inside a request
+            _int8_dot(np.zeros((1, 1), dtype=np.int8), np.zeros(1, dtype=np.float32), np.empty(1, dtype=np.float32))
+        
+        self._ids: Dict[str, int] = {}
+        # Row-ordered ids, documents and metadata, appended alongside the row arrays
+        self._id_list: List[str] = []
+        self._documents: List[str] = []
+        self._metadatas: List[Dict[str, Any]] = []
+        
+        # Row arrays grow by doubling, so only the first _size rows are live.
+        # int8 rows are quantized symmetrically (x ~= codes * scale); bfloat16
+        # rows are stored as the upper 16 bits of each fp32 value, scale 1
+        self._size = 0
+        self._codes: Optional[np.ndarray] = None      # (capacity, D)
+        self._scales = np.empty(0, dtype=np.float32)  # (capacity,)
+        self._bits: Optional[np.ndarray] = None       # (capacity, ceil(D / 8)) packed sign bits
+    
+    def count(self) -> int:
+        """Number of stored embeddings"""
+        return self._size
+    
+    def add(
+        self,
+        ids: List[str],
+        embeddings: List[List[float]],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]]
+    ):
+        """
+        Add embeddings with their documents and metadata
+        
+        Like ChromaDB, ids that already exist are skipped.
+        """
+        keep = []
+        for i, chunk_id in enumerate(ids):
+            if chunk_id in self._ids:
+                logger.warning(f"Skipping existing embedding ID: {chunk_id}")
+                continue
+            self._ids[chunk_id] = self._size + len(keep)
+            keep.append(i)
+        
+        if not keep:
+            return
+        
+        vectors = np.asarray(embeddings, dtype=np.float32)[keep]
+        codes, scales = self._encode(vectors)
+        
+        self._reserve(len(keep), vectors.shape[1])
+        end = self._size + len(keep)
+        self._codes[self._size:end] = codes
+        self._scales[self._size:end] = scales
+        self._bits[self._size:end] = np.packbits(vectors > 0, axis=1)
+        self._size = end
+        
+        self._id_list.extend(ids[i] for i in keep)
+        self._documents.extend(documents[i] for i in keep)
+        self._metadatas.extend(metadatas[i] for i in keep)
+    
+    def query(self, query_embeddings: List[List[float]], n_results: int = 10) -> Dict[str, List[List[Any]]]:
+        """
+        Find the nearest stored embeddings by inner product
+        
+        Queries stay in fp32 against the stored codes (asymmetric distance), which
+        keeps recall close to an unquantized search. Large quantized stores are first
+        narrowed to a candidate set by sign-bit Hamming distance.
+        
+        Returns:
+            ChromaDB-style results: ids, documents, metadatas and inner product
+            distances (1 - dot), one list per query embedding
+        """
+        results = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        for query_embedding in query_embeddings:
+            if self._size == 0:
+                for values in results.values():
+                    values.append([])
+                continue
+            
+            q = np.asarray(query_embedding, dtype=np.float32)
+            # The Numba kernel does no bounds checks, so a mismatched query must not reach it
+            if q.shape != (self._codes.shape[1],):
+                raise ValueError(
+                    f"Query embedding has shape {q.shape}, expected ({self._codes.shape[1]},)"
+                )
+            
+            rows = None
+            candidates = max(_RERANK_CANDIDATES, _RERANK_OVERSAMPLE * n_results)
+            if (
+                self.prefilter_min_rows is not None
+                and self._size >= self.prefilter_min_rows
+                and self._size > candidates
+            ):
+                q_bits = np.packbits(q > 0)
+                hamming = _popcount(self._bits[:self._size] ^ q_bits).sum(axis=1, dtype=np.uint32)
+                rows = np.argpartition(hamming, candidates - 1)[:candidates]
+            
+            similarities = self._dot(q, rows)
+            
+            k = min(n_results, len(similarities))
+            top = np.argpartition(-similarities, k - 1)[:k]
+            top = top[np.argsort(-similarities[top])]
+            similarities = similarities[top]
+            if rows is not None:
+                top = rows[top]
+            
+            results["ids"].append([self._id_list[i] for i in top])
+            results["documents"].append([self._documents[i] for i in top])
+            results["metadatas"].append([self._metadatas[i] for i in top])
+            results["distances"].append((1.0 - similarities).tolist())
+        
+        return results
+    
+    def _reserve(self, extra: int, dim: int):
+        """Make room for extra rows, doubling capacity to amortize copies"""
+        needed = self._size + extra
+        capacity = 0 if self._codes is None else len(self._codes)
+        if needed <= capacity:
+            return
+        
+        capacity = max(needed, 2 * capacity, _INITIAL_CAPACITY)
+        
+        codes = np.empty((capacity, dim), dtype=EMBEDDING_DTYPES[self.dtype])
+        scales = np.empty(capacity, dtype=np.float32)
+        bits = np.empty((capacity, (dim + 7) // 8), dtype=np.uint8)
+        if self._codes is not None:
+            codes[:self._size] = self._codes[:self._size]
+            scales[:self._size] = self._scales[:self._size]
+            bits[:self._size] = self._bits[:self._size]
+        
+        self._codes, self._scales, self._bits = codes, scales, bits
+    
+    def _encode(self, vectors: np.ndarray):
+        """Compress fp32 rows to the storage dtype: returns (codes, scales)"""
+        if self.dtype == "int8":
+            # Per-row symmetric quantization
+            scales = np.abs(vectors).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            codes = np.round(vectors / scales[:, None]).astype(np.int8)
+            return codes, scales.astype(np.float32)
+        
+        if self.dtype == "float32":
+            return vectors, np.ones(len(vectors), dtype=np.float32)
+        
+        # bfloat16: keep the top 16 bits of each fp32, rounding to nearest even
+        bits = vectors.view(np.uint32)
+        codes = ((bits + 0x7FFF + ((bits >> 16) & 1)) >> 16).astype(np.uint16)
+        return codes, np.ones(len(vectors), dtype=np.float32)
+    
+    def _dot(self, q: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Dot product of the stored rows (all of them by default) with an fp32 query"""
+        if rows is None:
+            rows = slice(0, self._size)
+        codes = self._codes[rows]
+        
+        if self.dtype == "int8":
+            if _int8_dot is not None:
+                dots = np.empty(len(codes), dtype=np.float32)
+                _int8_dot(codes, q, dots)
+                return dots * self._scales[rows]
+            return (codes.astype(np.float32) @ q) * self._scales[rows]
+        if self.dtype == "float32":
+            return codes @ q
+        
+        # Widen bfloat16 back to fp32 only for the scan
+        return (codes.astype(np.uint32) << 16).view(np.float32) @ q
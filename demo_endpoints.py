@@ -3,27 +3,41 @@ AI Enterprise Platform - Demo Script
 Demonstrates the key endpoints and functionality
 """
 
-import json
+import io
+import sys
+import orjson
 from datetime import datetime
+from functools import partial
 
-print("=" * 80)
-print("AI ENTERPRISE PLATFORM - ENDPOINT DEMO")
-print("=" * 80)
-print()
+
+def dumps(obj):
+    """Pretty-print obj as JSON (orjson serializes datetimes natively)"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
+# Collect all output in memory and write it to stdout once at the end
+buf = io.StringIO()
+emit = partial(print, file=buf)
+
+
+emit("=" * 80)
+emit("AI ENTERPRISE PLATFORM - ENDPOINT DEMO")
+emit("=" * 80)
+emit()
 
 # Simulate AI Service Endpoints
-print("🤖 PYTHON AI SERVICE (FastAPI) - Port 8000")
-print("-" * 80)
+emit("🤖 PYTHON AI SERVICE (FastAPI) - Port 8000")
+emit("-" * 80)
 
-print("\n1. RAG Query Endpoint: POST /api/rag/query")
-print("   Description: Query the RAG system with enterprise documentation")
+emit("\n1. RAG Query Endpoint: POST /api/rag/query")
+emit("   Description: Query the RAG system with enterprise documentation")
 rag_request = {
     "query": "What are the data privacy requirements for AI projects?",
     "conversation_id": "demo-123",
     "top_k": 5,
     "include_sources": True
 }
-print(f"   Request: {json.dumps(rag_request, indent=2)}")
+emit(f"   Request: {dumps(rag_request)}")
 
 rag_response = {
     "answer": "All AI projects must comply with data privacy regulations including GDPR and CCPA. Key requirements include: 1) Data minimization - collect only necessary data, 2) Encryption at rest and in transit, 3) Role-based access control (RBAC), 4) Privacy impact assessment for projects handling PII, and 5) Data retention policies.",
@@ -39,16 +53,16 @@ rag_response = {
     "confidence_score": 0.89,
     "processing_time_ms": 1234.5
 }
-print(f"   Response: {json.dumps(rag_response, indent=2)}")
+emit(f"   Response: {dumps(rag_response)}")
 
-print("\n2. Agentic Task Endpoint: POST /api/agentic/execute")
-print("   Description: Execute multi-step reasoning with tool calling")
+emit("\n2. Agentic Task Endpoint: POST /api/agentic/execute")
+emit("   Description: Execute multi-step reasoning with tool calling")
 agentic_request = {
     "task_description": "What is the current risk distribution across all AI projects?",
     "context": {},
     "max_steps": 10
 }
-print(f"   Request: {json.dumps(agentic_request, indent=2)}")
+emit(f"   Request: {dumps(agentic_request)}")
 
 agentic_response = {
     "task_id": "task-456",
@@ -67,10 +81,10 @@ agentic_response = {
     "success": True,
     "processing_time_ms": 2345.6
 }
-print(f"   Response: {json.dumps(agentic_response, indent=2)}")
+emit(f"   Response: {dumps(agentic_response)}")
 
-print("\n3. Risk Assessment Endpoint: POST /api/risk/assess")
-print("   Description: Assess risk for a new AI project")
+emit("\n3. Risk Assessment Endpoint: POST /api/risk/assess")
+emit("   Description: Assess risk for a new AI project")
 risk_request = {
     "project_name": "Customer Sentiment Analysis",
     "description": "Analyze customer feedback using NLP to identify sentiment and key themes",
@@ -78,7 +92,7 @@ risk_request = {
     "use_case": "Customer Experience Enhancement",
     "stakeholders": ["Product Team", "Customer Success", "Data Science"]
 }
-print(f"   Request: {json.dumps(risk_request, indent=2)}")
+emit(f"   Request: {dumps(risk_request)}")
 
 risk_response = {
     "project_name": "Customer Sentiment Analysis",
@@ -116,15 +130,15 @@ risk_response = {
     "approval_required": True,
     "assessment_timestamp": datetime.utcnow().isoformat()
 }
-print(f"   Response: {json.dumps(risk_response, indent=2, default=str)}")
+emit(f"   Response: {dumps(risk_response)}")
 
 # Simulate Governance Service Endpoints
-print("\n" + "=" * 80)
-print("🏢 .NET GOVERNANCE SERVICE (ASP.NET Core) - Port 5000")
-print("-" * 80)
+emit("\n" + "=" * 80)
+emit("🏢 .NET GOVERNANCE SERVICE (ASP.NET Core) - Port 5000")
+emit("-" * 80)
 
-print("\n4. Get All Projects: GET /api/projects")
-print("   Description: Retrieve all AI projects with optional filtering")
+emit("\n4. Get All Projects: GET /api/projects")
+emit("   Description: Retrieve all AI projects with optional filtering")
 projects_response = [
     {
         "id": "proj-001",
@@ -155,10 +169,10 @@ projects_response = [
         "updatedAt": "2026-02-04T09:15:00Z"
     }
 ]
-print(f"   Response: {json.dumps(projects_response, indent=2)}")
+emit(f"   Response: {dumps(projects_response)}")
 
-print("\n5. Create Project: POST /api/projects")
-print("   Description: Register a new AI project (triggers automatic risk assessment)")
+emit("\n5. Create Project: POST /api/projects")
+emit("   Description: Register a new AI project (triggers automatic risk assessment)")
 create_request = {
     "name": "Chatbot Assistant",
     "description": "AI-powered customer support chatbot",
@@ -166,7 +180,7 @@ create_request = {
     "dataSources": ["FAQ database", "Support history"],
     "stakeholders": ["Support Team", "Engineering"]
 }
-print(f"   Request: {json.dumps(create_request, indent=2)}")
+emit(f"   Request: {dumps(create_request)}")
 
 create_response = {
     "id": "proj-003",
@@ -182,10 +196,10 @@ create_response = {
     "createdAt": datetime.utcnow().isoformat(),
     "updatedAt": datetime.utcnow().isoformat()
 }
-print(f"   Response: {json.dumps(create_response, indent=2, default=str)}")
+emit(f"   Response: {dumps(create_response)}")
 
-print("\n6. Get Project Metrics: GET /api/projects/metrics")
-print("   Description: Get organization-wide AI project metrics")
+emit("\n6. Get Project Metrics: GET /api/projects/metrics")
+emit("   Description: Get organization-wide AI project metrics")
 metrics_response = {
     "totalProjects": 24,
     "activeProjects": 18,
@@ -196,68 +210,70 @@ metrics_response = {
         {"riskLevel": "High", "count": 3}
     ]
 }
-print(f"   Response: {json.dumps(metrics_response, indent=2)}")
+emit(f"   Response: {dumps(metrics_response)}")
 
-print("\n7. Approve Project: POST /api/projects/{id}/approve")
-print("   Description: Approve a pending AI project")
+emit("\n7. Approve Project: POST /api/projects/{id}/approve")
+emit("   Description: Approve a pending AI project")
 approve_response = {
     "id": "proj-001",
     "name": "Customer Sentiment Analysis",
     "status": "Approved",
     "updatedAt": datetime.utcnow().isoformat()
 }
-print(f"   Response: {json.dumps(approve_response, indent=2, default=str)}")
+emit(f"   Response: {dumps(approve_response)}")
 
 # React Frontend Routes
-print("\n" + "=" * 80)
-print("⚛️  REACT FRONTEND (Vite) - Port 3000")
-print("-" * 80)
+emit("\n" + "=" * 80)
+emit("⚛️  REACT FRONTEND (Vite) - Port 3000")
+emit("-" * 80)
 
-print("\n8. Dashboard: http://localhost:3000/")
-print("   Features:")
-print("   - Project metrics cards (Total, Active, Pending, High Risk)")
-print("   - Risk distribution pie chart")
-print("   - Recent projects list")
-print("   - Key insights panel")
+emit("\n8. Dashboard: http://localhost:3000/")
+emit("   Features:")
+emit("   - Project metrics cards (Total, Active, Pending, High Risk)")
+emit("   - Risk distribution pie chart")
+emit("   - Recent projects list")
+emit("   - Key insights panel")
 
-print("\n9. Project Registry: http://localhost:3000/projects")
-print("   Features:")
-print("   - Create new AI project form")
-print("   - Projects table with search/filter")
-print("   - Risk level badges")
-print("   - Status tracking")
+emit("\n9. Project Registry: http://localhost:3000/projects")
+emit("   Features:")
+emit("   - Create new AI project form")
+emit("   - Projects table with search/filter")
+emit("   - Risk level badges")
+emit("   - Status tracking")
 
-print("\n10. AI Assistant: http://localhost:3000/assistant")
-print("    Features:")
-print("    - Chat interface with RAG system")
-print("    - Message history")
-print("    - Source citations")
-print("    - Suggested questions")
+emit("\n10. AI Assistant: http://localhost:3000/assistant")
+emit("    Features:")
+emit("    - Chat interface with RAG system")
+emit("    - Message history")
+emit("    - Source citations")
+emit("    - Suggested questions")
 
-print("\n11. Risk & Compliance: http://localhost:3000/risk")
-print("    Features:")
-print("    - Risk overview cards (Low/Medium/High)")
-print("    - Project selection dropdown")
-print("    - Risk dimension breakdown")
-print("    - Compliance requirements list")
-print("    - Mitigation recommendations")
+emit("\n11. Risk & Compliance: http://localhost:3000/risk")
+emit("    Features:")
+emit("    - Risk overview cards (Low/Medium/High)")
+emit("    - Project selection dropdown")
+emit("    - Risk dimension breakdown")
+emit("    - Compliance requirements list")
+emit("    - Mitigation recommendations")
 
 # Summary
-print("\n" + "=" * 80)
-print("📊 SUMMARY")
-print("-" * 80)
-print(f"✅ Total Endpoints Demonstrated: 11")
-print(f"✅ Python AI Service: 3 endpoints (RAG, Agentic, Risk Assessment)")
-print(f"✅ .NET Governance Service: 4 endpoints (CRUD + Metrics)")
-print(f"✅ React Frontend: 4 routes (Dashboard, Projects, Assistant, Risk)")
-print()
-print("🎯 Skills Showcased:")
-print("   - Python: FastAPI, async/await, LangChain, Pydantic")
-print("   - .NET: ASP.NET Core, Entity Framework, LINQ")
-print("   - React: Hooks, Router, State Management, TailwindCSS")
-print("   - AI/ML: RAG, Vector Embeddings, Agentic AI, Risk Assessment")
-print("   - Architecture: Microservices, REST APIs, Multi-database")
-print()
-print("=" * 80)
-print("Demo complete! This showcases the AI Enterprise Platform capabilities.")
-print("=" * 80)
+emit("\n" + "=" * 80)
+emit("📊 SUMMARY")
+emit("-" * 80)
+emit(f"✅ Total Endpoints Demonstrated: 11")
+emit(f"✅ Python AI Service: 3 endpoints (RAG, Agentic, Risk Assessment)")
+emit(f"✅ .NET Governance Service: 4 endpoints (CRUD + Metrics)")
+emit(f"✅ React Frontend: 4 routes (Dashboard, Projects, Assistant, Risk)")
+emit()
+emit("🎯 Skills Showcased:")
+emit("   - Python: FastAPI, async/await, LangChain, Pydantic")
+emit("   - .NET: ASP.NET Core, Entity Framework, LINQ")
+emit("   - React: Hooks, Router, State Management, TailwindCSS")
+emit("   - AI/ML: RAG, Vector Embeddings, Agentic AI, Risk Assessment")
+emit("   - Architecture: Microservices, REST APIs, Multi-database")
+emit()
+emit("=" * 80)
+emit("Demo complete! This showcases the AI Enterprise Platform capabilities.")
+emit("=" * 80)
+
+sys.stdout.write(buf.getvalue())